@@ -1,8 +1,21 @@
 import robin_stocks.robinhood as r
-import pandas as pd
-import time
+import robin_stocks.robinhood.helper as robinhood_helper
+import numpy as np
 import gspread
-from typing import List, Dict, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, HTTPError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from urllib3.util.retry import Retry
+import asyncio
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import dotenv
 
 GOOGLE_SHEETS_CREDENTIALS_PATH = dotenv.get_key('.env', 'GOOGLE_SHEETS_CREDENTIALS_PATH')   
@@ -13,40 +26,297 @@ WORKSHEET_NAME = '24 Hour Market Data'
 ROBINHOOD_USERNAME = '' 
 ROBINHOOD_PASSWORD = ''
 WATCHLIST_NAME = '24 Hour Market'
-CHUNK_SIZE = 100 
+# Default fundamentals batch size; the discovered per-request cap is persisted
+# in .cache/chunk_size and grows run-over-run up to CHUNK_SIZE_MAX while the
+# endpoint keeps returning complete batches.
+CHUNK_SIZE = 100
+CHUNK_SIZE_MAX = 400
+MAX_WORKERS = 8
+# Robinhood request budget for the token-bucket limiter: at most RATE_LIMIT
+# requests in any RATE_PERIOD-second window.
+RATE_LIMIT = 6
+RATE_PERIOD = 1.0
+
+# --- ON-DISK CACHE CONFIGURATION ---
+# The watchlist and fundamentals change slowly compared to prices, so cache
+# them for a day; prices are never cached and always refetched. Fundamentals
+# older than the fresh TTL are still served stale (up to the stale TTL) while
+# a background refresh rewrites the cache for the next run.
+CACHE_DIR = Path('.cache')
+WATCHLIST_TTL = 24 * 3600
+FUNDAMENTALS_TTL = 24 * 3600
+FUNDAMENTALS_STALE_TTL = 7 * 24 * 3600
+# How long the current run waits for a background refresh before settling
+# for the stale payload.
+REFRESH_RACE_TIMEOUT = 2.0
+
 
-def format_market_cap(market_cap_str: Optional[str]) -> Tuple[str, str]:
+def _cache_read(key: str) -> Optional[Tuple[float, Any]]:
     """
-    Converts a raw market cap number string into a formatted tuple: (Value, Unit).
-    (e.g., '4440000000000.00' -> ('4.44', 'T')).
-    
-    Returns a tuple of (Formatted Market Cap Value, Unit String).
+    Returns the raw (timestamp, payload) entry stored under `key`, or None
+    on a miss/unreadable entry.
     """
-    if not market_cap_str:
-        return "N/A", ""
+    path = CACHE_DIR / f"{key}.pkl"
     try:
-        cap = float(market_cap_str)
-        
-        # Check for Trillions (10^12)
-        if cap >= 1e12:
-            value = cap / 1e12
-            return f"{value:.2f}", "T"
-        # Check for Billions (10^9)
-        elif cap >= 1e9:
-            value = cap / 1e9
-            return f"{value:.2f}", "B"
-        # Check for Millions (10^6)
-        elif cap >= 1e6:
-            value = cap / 1e6
-            return f"{value:.2f}", "M"
-        else:
-            # For smaller caps, return the full value and an empty unit string
-            return f"{cap:.2f}", "" 
-    except (ValueError, TypeError):
-        return "N/A", ""
+        with path.open('rb') as fh:
+            return pickle.load(fh)
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        return None
+
+
+def cache_get(key: str, ttl: float) -> Any:
+    """
+    Returns the cached payload stored under `key` if it is younger than
+    `ttl` seconds, or None on a miss/expiry/unreadable entry.
+    """
+    if ttl <= 0:
+        return None
+    entry = _cache_read(key)
+    if entry is None or time.time() - entry[0] >= ttl:
+        return None
+    return entry[1]
+
+
+def cache_put(key: str, payload: Any):
+    """
+    Stores `payload` under `key` with the current timestamp. The entry is
+    written to a temp file and atomically renamed so concurrent readers
+    (including background refresh threads) never see a partial write.
+    Cache write failures are non-fatal; the data was already fetched.
+    """
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        path = CACHE_DIR / f"{key}.pkl"
+        tmp_path = path.with_suffix('.pkl.tmp')
+        with tmp_path.open('wb') as fh:
+            pickle.dump((time.time(), payload), fh)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"WARNING: Could not write cache entry '{key}': {e}")
+
+
+def _load_chunk_size() -> int:
+    """
+    Returns the fundamentals batch size discovered on previous runs, or the
+    CHUNK_SIZE default when nothing sane has been persisted yet.
+    """
+    try:
+        size = int((CACHE_DIR / 'chunk_size').read_text().strip())
+        if 0 < size <= CHUNK_SIZE_MAX:
+            return size
+    except (OSError, ValueError):
+        pass
+    return CHUNK_SIZE
+
+
+def _save_chunk_size(size: int):
+    """Persists the batch size to use on the next run; failures are non-fatal."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        (CACHE_DIR / 'chunk_size').write_text(str(size))
+    except OSError as e:
+        print(f"WARNING: Could not persist chunk size: {e}")
+
+
+def _tune_chunk_size(chunk_size: int, ticker_chunks: Sequence[Sequence[str]],
+                     records_returned: int, records_expected: int):
+    """
+    Adjusts the persisted batch size based on how this run's fundamentals
+    fetch went: if at least one full-size batch came back and the record
+    count is complete, the endpoint's cap has not been hit, so double the
+    size (bounded by CHUNK_SIZE_MAX) for the next run. An incomplete record
+    set at an enlarged size falls back to the CHUNK_SIZE default.
+    """
+    full_batch_sent = any(len(chunk) == chunk_size for chunk in ticker_chunks)
+    if records_returned == records_expected:
+        if full_batch_sent and chunk_size < CHUNK_SIZE_MAX:
+            new_size = min(chunk_size * 2, CHUNK_SIZE_MAX)
+            _save_chunk_size(new_size)
+            print(f"INFO: Batches of {chunk_size} came back complete; trying {new_size} next run.")
+    elif chunk_size > CHUNK_SIZE:
+        _save_chunk_size(CHUNK_SIZE)
+        print(f"INFO: Batches of {chunk_size} came back incomplete; reverting to {CHUNK_SIZE} next run.")
+
+
+def _fundamentals_cache_key(chunk: Sequence[str]) -> str:
+    """Stable cache key for a fundamentals batch, independent of ticker order."""
+    digest = hashlib.sha1(','.join(sorted(chunk)).encode()).hexdigest()
+    return f"funds-{digest}"
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket rate limiter.
 
+    Tracks the monotonic timestamps of recent requests in a deque; acquire()
+    blocks until fewer than `rate` requests have been issued in the trailing
+    `per` seconds. Unlike a fixed sleep between calls, this only waits when
+    the budget is actually exhausted.
+    """
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self._timestamps: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # Drop timestamps that have aged out of the window
+                while self._timestamps and now - self._timestamps[0] >= self.per:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.rate:
+                    self._timestamps.append(now)
+                    return
+                # Budget exhausted: wait until the oldest timestamp expires
+                wait = self.per - (now - self._timestamps[0])
+            time.sleep(max(wait, 0.01))
+
+
+# Shared limiter paces every Robinhood request issued by the worker threads.
+_robinhood_limiter = RateLimiter(RATE_LIMIT, RATE_PERIOD)
+
+def _to_float_array(values: Sequence[Any]) -> np.ndarray:
+    """
+    Coerces raw string/number values into a float64 array, mapping missing
+    or unparseable entries to NaN.
+    """
+    def coerce(value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+    return np.fromiter((coerce(v) for v in values), dtype=np.float64, count=len(values))
+
+
+# Lookup tables for the branchless market-cap magnitude mapping: index 0 is
+# "no unit", then Millions (10^6), Billions (10^9), Trillions (10^12).
+_CAP_DIVISORS_LUT = np.array([1.0, 1e6, 1e9, 1e12])
+_CAP_UNITS_LUT = np.array(['', 'M', 'B', 'T'])
+
+
+def format_market_caps(caps: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts an array of raw market cap numbers into two parallel string
+    arrays: (Values, Units) (e.g., 4440000000000.0 -> ('4.44', 'T')).
+
+    Operates on the whole column at once with NumPy instead of branching
+    per row; missing/unparseable caps (NaN) come back as ('N/A', '').
+    """
+    # Map each cap to a LUT index from its decimal magnitude: floor(log10)//3
+    # gives 2 for millions, 3 for billions, 4+ for trillions; clipping the
+    # shifted result to [0, 3] folds sub-million caps onto the unitless entry
+    # and anything above trillions onto 'T'. One log pass plus two gathers,
+    # no boolean-mask sweeps. NaN and non-positive caps are masked to 1.0
+    # first so log10 stays warning-free; they land on index 0.
+    positive = caps > 0
+    magnitude = np.floor(np.log10(np.where(positive, caps, 1.0))).astype(np.int32) // 3
+    idx = np.clip(np.where(positive, magnitude - 1, 0), 0, 3)
+    divisors = _CAP_DIVISORS_LUT[idx]
+    units = _CAP_UNITS_LUT[idx]
+
+    missing = np.isnan(caps)
+    values = np.where(missing, 'N/A', np.char.mod('%.2f', caps / divisors))
+    units = np.where(missing, '', units)
+    return values, units
 
-def fetch_latest_prices(tickers: List[str]) -> Dict[str, str]:
+
+def configure_robinhood_session():
+    """
+    Mounts a pooled, retrying HTTPAdapter on the requests.Session that
+    robin_stocks uses internally, so the parallel workers reuse keep-alive
+    connections instead of paying a TLS + TCP handshake per request, and
+    transient 429/5xx responses are retried with backoff at the transport
+    layer.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[429, 500, 502, 503, 504])
+    )
+    robinhood_helper.SESSION.mount('https://', adapter)
+
+
+def _log_retry(retry_state):
+    """Prints a one-line notice before tenacity sleeps between attempts."""
+    print(f"WARNING: {retry_state.fn.__name__} attempt {retry_state.attempt_number} failed; retrying...")
+
+
+# Application-level retry policy for the Robinhood calls: up to 5 attempts
+# with jittered exponential backoff on transient HTTP/connection errors, so
+# a throttled or flaky batch recovers instead of losing its whole chunk.
+_remote_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=0.5, max=8),
+    retry=retry_if_exception_type((HTTPError, RequestsConnectionError)),
+    before_sleep=_log_retry,
+)
+
+
+@_remote_retry
+def _call_fundamentals(chunk: Sequence[str]) -> Any:
+    """Fetches one fundamentals batch, paced by the shared rate limiter."""
+    _robinhood_limiter.acquire()
+    return r.stocks.get_fundamentals(chunk)
+
+
+@_remote_retry
+def _call_prices(tickers: Sequence[str]) -> Any:
+    """Fetches the latest price quotes, paced by the shared rate limiter."""
+    _robinhood_limiter.acquire()
+    return r.stocks.get_latest_price(tickers)
+
+
+# Dedicated pool for stale-while-revalidate refreshes, so they never compete
+# with the main fetch workers for slots.
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='swr-refresh')
+
+
+def _refresh_fundamentals_chunk(chunk: Sequence[str], key: str) -> Any:
+    """
+    Fetches the fundamentals batch (rate-limited, with retries) and
+    rewrites its cache entry.
+    """
+    result = _call_fundamentals(chunk)
+    if result:
+        cache_put(key, result)
+    return result
+
+
+def _fetch_fundamentals_chunk(chunk: Sequence[str]) -> Any:
+    """
+    Worker-thread task body with stale-while-revalidate semantics:
+
+    - fresh cache entry: return it, no network.
+    - stale (but not too old) entry: kick off a background refresh and
+      serve the stale payload, unless the refresh lands within
+      REFRESH_RACE_TIMEOUT, in which case the new data is used directly.
+    - miss or too old: fetch synchronously.
+    """
+    key = _fundamentals_cache_key(chunk)
+    entry = _cache_read(key)
+    if entry is not None:
+        age = time.time() - entry[0]
+        if age < FUNDAMENTALS_TTL:
+            return entry[1]
+        if age < FUNDAMENTALS_STALE_TTL:
+            future = _refresh_executor.submit(_refresh_fundamentals_chunk, chunk, key)
+            try:
+                return future.result(timeout=REFRESH_RACE_TIMEOUT) or entry[1]
+            except FutureTimeoutError:
+                # Refresh keeps running in the background and will be
+                # picked up from the cache on the next run.
+                return entry[1]
+            except Exception as e:
+                print(f"WARNING: Fundamentals refresh failed ({e}); serving stale cache entry.")
+                return entry[1]
+
+    return _refresh_fundamentals_chunk(chunk, key)
+
+
+def fetch_latest_prices(tickers: Sequence[str]) -> Dict[str, str]:
     """
     Fetches the latest real-time price for a list of tickers.
     """
@@ -56,16 +326,18 @@ def fetch_latest_prices(tickers: List[str]) -> Dict[str, str]:
         
     try:
         # Get the latest price quotes for all tickers
-        latest_prices_list = r.stocks.get_latest_price(tickers)
+        latest_prices_list = _call_prices(tickers)
         
         if latest_prices_list and isinstance(latest_prices_list, list):
-            for ticker, price_str in zip(tickers, latest_prices_list):
-                try:
-                    price = float(price_str)
-                    prices[ticker] = f"${price:.2f}"
-                except (ValueError, TypeError):
-                    prices[ticker] = 'N/A'
-        
+            # Format the whole quote list in one vectorized pass: coerce to
+            # floats (unparseable entries become NaN -> 'N/A'), then render
+            # and '$'-prefix every value at once.
+            values = _to_float_array(latest_prices_list)
+            formatted = np.where(np.isnan(values), 'N/A',
+                                 np.char.add('$', np.char.mod('%.2f', values)))
+            prices = dict(zip(tickers, formatted))
+
+
         print(f"--- Successfully fetched latest prices for {len(prices)} tickers. ---")
     except Exception as e:
         print(f"WARNING: Failed to fetch latest prices: {e}")
@@ -74,41 +346,128 @@ def fetch_latest_prices(tickers: List[str]) -> Dict[str, str]:
     return prices
 
 
-def upload_to_google_sheets(df: pd.DataFrame):
+def fetch_fundamentals_parallel(tickers: Sequence[str],
+                                ticker_chunks: Sequence[Sequence[str]]) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Fetches all fundamentals batches concurrently on a thread pool and
+    streams each record straight into preallocated per-ticker arrays as it
+    arrives, instead of accumulating an intermediate list of dicts.
+
+    Returns (api_names, raw_caps, records_returned): object arrays indexed
+    by the ticker's position in `tickers`, holding the API-reported company
+    name and raw market_cap string (None where the API returned nothing),
+    plus the total record count for the chunk-size tuner.
+    """
+    sym_to_idx = {sym: i for i, sym in enumerate(tickers)}
+    api_names = np.empty(len(tickers), dtype=object)
+    raw_caps = np.empty(len(tickers), dtype=object)
+    records_returned = 0
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(_fetch_fundamentals_chunk, chunk): chunk for chunk in ticker_chunks}
+        for completed, future in enumerate(as_completed(futures), start=1):
+            chunk = futures[future]
+            print(f"  > Completed batch {completed}/{len(futures)} ({len(chunk)} tickers)...")
+
+            chunk_fundamentals = future.result()
+
+            if isinstance(chunk_fundamentals, dict):
+                chunk_fundamentals = chunk_fundamentals.get('results', [])
+            if not isinstance(chunk_fundamentals, list):
+                continue
+
+            records_returned += len(chunk_fundamentals)
+            for fund in chunk_fundamentals:
+                if not (fund and isinstance(fund, dict)):
+                    continue
+                idx = sym_to_idx.get(fund.get('symbol'))
+                if idx is None:
+                    continue
+                api_names[idx] = fund.get('name')
+                raw_caps[idx] = fund.get('market_cap')
+
+    return api_names, raw_caps, records_returned
+
+
+async def fetch_market_data(tickers: Sequence[str],
+                            ticker_chunks: Sequence[Sequence[str]]
+                            ) -> Tuple[Dict[str, str], Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Runs the prices fetch and the threaded fundamentals fetcher concurrently
+    (both are sync robin_stocks code, pushed off the event loop with
+    asyncio.to_thread) and returns (latest_prices_map, fundamentals arrays).
+    """
+    prices_task = asyncio.create_task(asyncio.to_thread(fetch_latest_prices, tickers))
+    funds_task = asyncio.create_task(asyncio.to_thread(fetch_fundamentals_parallel, tickers, ticker_chunks))
+    prices_map, fundamentals = await asyncio.gather(prices_task, funds_task)
+    return prices_map, fundamentals
+
+
+# Cached Google Sheets handles so repeated invocations (e.g. from a
+# scheduler loop) only pay the service-account JWT exchange and the
+# spreadsheet/worksheet metadata fetches once; google-auth refreshes the
+# access token transparently on subsequent requests.
+_spreadsheet: Optional[gspread.Spreadsheet] = None
+_worksheet: Optional[gspread.Worksheet] = None
+
+
+def _get_spreadsheet() -> gspread.Spreadsheet:
     """
-    Authenticates with Google Sheets and uploads the DataFrame to the target spreadsheet.
+    Returns the target spreadsheet, authenticating with the service account
+    and opening it by URL only on the first call.
+    """
+    global _spreadsheet
+    if _spreadsheet is None:
+        gc = gspread.service_account(filename=GOOGLE_SHEETS_CREDENTIALS_PATH)
+        _spreadsheet = gc.open_by_url(SPREADSHEET_URL)
+    return _spreadsheet
+
+
+def upload_to_google_sheets(header: List[str], rows: List[List[str]]):
+    """
+    Authenticates with Google Sheets and uploads the pre-serialized rows to
+    the target spreadsheet. Takes the 2D cell list directly (rather than a
+    DataFrame) so no object-dtype copy of the data is materialized here.
     Explicitly uses 'A1' for the start range to ensure headers are included.
     """
+    global _spreadsheet, _worksheet
     print("--- Attempting to connect to Google Sheets... ---")
     try:
-        # Authenticate using the service account JSON file
-        gc = gspread.service_account(filename=GOOGLE_SHEETS_CREDENTIALS_PATH)
-        
-        # Open the sheet by URL (gspread supports URLs directly)
-        spreadsheet = gc.open_by_url(SPREADSHEET_URL)
-        
-        # Check if the target worksheet exists, and create it if it doesn't, or clear it if it does
+        spreadsheet = _get_spreadsheet()
+
+        # Check if the target worksheet exists, and create it if it doesn't.
+        # When the sheet's shape already matches the upload (the usual case
+        # for a stable watchlist), the scoped update below overwrites every
+        # cell anyway, so the clear() round-trip is skipped; only a sheet
+        # with leftover rows/columns beyond the new data still gets cleared.
         try:
-            worksheet = spreadsheet.worksheet(WORKSHEET_NAME)
-            # Clear existing data but keep any column/row formatting
-            worksheet.clear()
-            print(f"INFO: Cleared existing worksheet: '{WORKSHEET_NAME}'")
+            worksheet = _worksheet if _worksheet is not None else spreadsheet.worksheet(WORKSHEET_NAME)
+            if worksheet.row_count == len(rows) + 1 and worksheet.col_count == len(header):
+                print(f"INFO: Worksheet '{WORKSHEET_NAME}' shape unchanged; skipping clear.")
+            else:
+                # Clear existing data but keep any column/row formatting
+                worksheet.clear()
+                print(f"INFO: Cleared existing worksheet: '{WORKSHEET_NAME}'")
         except gspread.WorksheetNotFound:
-            # Add new worksheet based on DataFrame size (+1 for header row)
-            worksheet = spreadsheet.add_worksheet(title=WORKSHEET_NAME, rows=df.shape[0] + 1, cols=df.shape[1])
+            # Add new worksheet based on data size (+1 for header row)
+            worksheet = spreadsheet.add_worksheet(title=WORKSHEET_NAME, rows=len(rows) + 1, cols=len(header))
             print(f"INFO: Created new worksheet: '{WORKSHEET_NAME}'")
+        _worksheet = worksheet
 
-        # Prepare data: header row followed by all data rows
-        header = df.columns.tolist()
-        data = df.values.tolist()
-        
-        # Fix for missing headers: Specify 'A1' range
-        worksheet.update([header] + data, 'A1', value_input_option='USER_ENTERED')
-        
-        print(f"\n✅ Google Sheets SUCCESS! {len(data)} rows uploaded.")
+        # Scope the update to exactly the cells being written. Every cell is
+        # a pre-formatted string, so RAW skips Sheets-side formula/number
+        # parsing that USER_ENTERED would do per cell.
+        end_cell = gspread.utils.rowcol_to_a1(len(rows) + 1, len(header))
+        worksheet.update([header] + rows, f'A1:{end_cell}', value_input_option='RAW')
+
+        print(f"\n✅ Google Sheets SUCCESS! {len(rows)} rows uploaded.")
         print(f"Spreadsheet URL: {SPREADSHEET_URL}")
 
     except Exception as e:
+        # Drop the cached handles so the next invocation re-authenticates
+        # from scratch instead of reusing a possibly-broken session.
+        _spreadsheet = None
+        _worksheet = None
         print(f"❌ ERROR connecting to or uploading to Google Sheets: {e}")
         print("Please ensure your GSheets configuration is correct.")
 
@@ -118,13 +477,10 @@ def export_24hr_market_to_csv_and_sheet():
     Logs into Robinhood, fetches the '24 Hour Market' watchlist, enriches the data
     with fundamental details and real-time prices, and exports the result to Google Sheets.
     """
-    
-    all_fundamentals = []
-    # instrument_map stores ticker details: {'symbol': {'Name': '...'}}
-    instrument_map: Dict[str, Dict[str, str]] = {} 
-    
+
     try:
-        # 1. Login to Robinhood
+        # 1. Login to Robinhood (with connection pooling sized for the workers)
+        configure_robinhood_session()
         print(f"--- Attempting to log in as {ROBINHOOD_USERNAME} ---")
         login_data = r.login(ROBINHOOD_USERNAME, ROBINHOOD_PASSWORD, store_session=True)
         
@@ -134,8 +490,14 @@ def export_24hr_market_to_csv_and_sheet():
 
         print(f"--- Successfully logged in. Fetching watchlist: '{WATCHLIST_NAME}' ---")
 
-        # 2. Get the list of instruments
-        watchlist_raw_data: Any = r.get_watchlist_by_name(WATCHLIST_NAME)
+        # 2. Get the list of instruments (cached on disk; membership changes
+        # slowly, so a day-old copy saves the round-trip on warm runs)
+        watchlist_cache_key = f"watchlist-{hashlib.sha1(WATCHLIST_NAME.encode()).hexdigest()}"
+        watchlist_raw_data: Any = cache_get(watchlist_cache_key, WATCHLIST_TTL)
+        if watchlist_raw_data is None:
+            watchlist_raw_data = r.get_watchlist_by_name(WATCHLIST_NAME)
+            if watchlist_raw_data:
+                cache_put(watchlist_cache_key, watchlist_raw_data)
 
         list_of_instruments: List[Dict[str, Any]]
         if isinstance(watchlist_raw_data, dict) and 'results' in watchlist_raw_data:
@@ -147,77 +509,63 @@ def export_24hr_market_to_csv_and_sheet():
             print(f"❌ ERROR: Watchlist '{WATCHLIST_NAME}' was retrieved but is empty or returned no data.")
             return
         
-        # 3. Extract Tickers and map them to their names.
-        for i in list_of_instruments:
-            if isinstance(i, dict) and i.get('symbol'):
-                symbol = i.get('symbol')
-                name = i.get('name')
-                instrument_map[symbol] = {'Name': name}
-        
-        unique_tickers = list(instrument_map.keys())
-            
+        # 3. Extract Tickers and map them to their names in a single pass;
+        # the dict deduplicates symbols while preserving watchlist order.
+        instrument_map = {
+            sym: {'Name': i.get('name')}
+            for i in list_of_instruments
+            if isinstance(i, dict) and (sym := i.get('symbol'))
+        }
+
+        unique_tickers = tuple(instrument_map)
+
         if not unique_tickers:
             print("❌ ERROR: Could not extract any valid ticker symbols from the watchlist data.")
             return
             
         print(f"✅ Retrieved {len(unique_tickers)} unique Ticker Symbols.")
         
-        # 4. FETCH THE REAL-TIME PRICES
-        latest_prices_map = fetch_latest_prices(unique_tickers)
-        
-        # 5. Get the Fundamental Data (Market Cap, Sector, Industry) in chunks
-        print(f"--- Fetching detailed fundamental data for all tickers in batches of {CHUNK_SIZE}... ---")
-        
-        ticker_chunks = [unique_tickers[i:i + CHUNK_SIZE] for i in range(0, len(unique_tickers), CHUNK_SIZE)]
-        
-        for i, chunk in enumerate(ticker_chunks):
-            print(f"  > Processing batch {i + 1}/{len(ticker_chunks)} ({len(chunk)} tickers)...")
-            time.sleep(0.5) 
-            
-            chunk_fundamentals = r.stocks.get_fundamentals(chunk) 
-            
-            if isinstance(chunk_fundamentals, list):
-                all_fundamentals.extend(chunk_fundamentals)
-            elif isinstance(chunk_fundamentals, dict) and chunk_fundamentals.get('results'):
-                 all_fundamentals.extend(chunk_fundamentals.get('results', []))
-            
-        print(f"--- Finished fetching fundamentals. Total records retrieved: {len(all_fundamentals)} ---")
-
-        # 6. Prepare the final DataFrame with required columns and formatting
-        final_data = []
-        for fund in all_fundamentals:
-            if fund and isinstance(fund, dict):
-                ticker = fund.get('symbol', 'N/A')
-                
-                # Get name and price
-                name = instrument_map.get(ticker, {}).get('Name', fund.get('name', 'N/A'))
-                price = latest_prices_map.get(ticker, 'N/A') 
-                
-                # --- MARKET CAP SPLIT ---
-                raw_market_cap = fund.get('market_cap')
-                formatted_cap_value, formatted_cap_unit = format_market_cap(raw_market_cap)
-
-                # Append data with the two new market cap fields
-                final_data.append({
-                    'Name': name,
-                    'Symbol': ticker,
-                    'Price': price,
-                    'Marketcap Value': formatted_cap_value,
-                    'Marketcap Unit': formatted_cap_unit
-                })
-                
-        # 7. Convert to a DataFrame
-        df = pd.DataFrame(final_data)
-        
-        if not df.empty:
-            # Explicitly define the column order for the final output
-            df = df[['Name', 'Symbol', 'Price', 'Marketcap Value', 'Marketcap Unit']]
-            
+        # 4 & 5. Fetch the real-time prices and the fundamental data
+        # (Market Cap, Sector, Industry) concurrently. Both stages are pure
+        # IO, so gathering them at the top level collapses total network
+        # time to roughly the slowest stage instead of the sum.
+        chunk_size = _load_chunk_size()
+        print(f"--- Fetching latest prices and fundamental data in batches of {chunk_size}... ---")
+
+        ticker_chunks = [unique_tickers[i:i + chunk_size] for i in range(0, len(unique_tickers), chunk_size)]
+
+        latest_prices_map, (api_names, raw_caps, records_returned) = asyncio.run(
+            fetch_market_data(unique_tickers, ticker_chunks))
+
+        # Let the next run use bigger (or safer) batches based on this one.
+        _tune_chunk_size(chunk_size, ticker_chunks, records_returned, len(unique_tickers))
+
+        print(f"--- Finished fetching fundamentals. Total records retrieved: {records_returned} ---")
+
+        # 6. The fetch already landed everything in per-ticker arrays, so
+        # the output columns follow watchlist order directly; the watchlist
+        # name wins over the API-reported one when both exist.
+        symbols = list(unique_tickers)
+        names = [instrument_map[sym].get('Name') or api_name or 'N/A'
+                 for sym, api_name in zip(unique_tickers, api_names)]
+        prices = [latest_prices_map.get(sym, 'N/A') for sym in unique_tickers]
+
+        # --- MARKET CAP SPLIT (vectorized over the whole column) ---
+        caps = _to_float_array(raw_caps)
+        cap_values, cap_units = format_market_caps(caps)
+
+        # 7. Zip the columns straight into the 2D cell list the Sheets API
+        # wants — every value is already a string, so no DataFrame copy is
+        # needed for the upload itself.
+        header = ['Name', 'Symbol', 'Price', 'Marketcap Value', 'Marketcap Unit']
+        rows = [list(row) for row in zip(names, symbols, prices, cap_values, cap_units)]
+
+        if rows:
             print("\n--- First 5 Rows of Transformed Data ---")
-            print(df.head().to_markdown(index=False))
-            
+            print('\n'.join('\t'.join(row) for row in [header] + rows[:5]))
+
             # 8. Upload to Google Sheets
-            upload_to_google_sheets(df)
+            upload_to_google_sheets(header, rows)
         else:
             print("❌ ERROR: Fundamental data fetching resulted in an empty dataset after merging.")
 